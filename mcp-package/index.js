@@ -22,39 +22,28 @@ async function setup() {
 
       const config = new Config();
       if (config.setApiKey(apiKey)) {
-        console.log('✅ API key saved successfully');
-        console.log('\n📋 Add this to your Claude Desktop config:');
-        console.log('File location: ~/.claude/claude_desktop_config.json');
-        console.log(JSON.stringify({
+        // Same server entry for every supported client
+        const clientConfig = JSON.stringify({
           "mcpServers": {
             "prompt-optimizer": {
               "command": "npx",
               "args": ["mcp-prompt-optimizer"]
             }
           }
-        }, null, 2));
+        }, null, 2);
+
+        console.log('✅ API key saved successfully');
+        console.log('\n📋 Add this to your Claude Desktop config:');
+        console.log('File location: ~/.claude/claude_desktop_config.json');
+        console.log(clientConfig);
         
         console.log('\n📋 Or for Cursor:');
         console.log('File location: ~/.cursor/mcp.json');
-        console.log(JSON.stringify({
-          "mcpServers": {
-            "prompt-optimizer": {
-              "command": "npx",
-              "args": ["mcp-prompt-optimizer"]
-            }
-          }
-        }, null, 2));
+        console.log(clientConfig);
 
         console.log('\n📋 Or for Windsurf:');
         console.log('Add via Windsurf settings or config file');
-        console.log(JSON.stringify({
-          "mcpServers": {
-            "prompt-optimizer": {
-              "command": "npx",
-              "args": ["mcp-prompt-optimizer"]
-            }
-          }
-        }, null, 2));
+        console.log(clientConfig);
 
         console.log('\n🎉 Setup complete! Restart your MCP client to use the tool.');
         console.log('💡 Run "mcp-prompt-optimizer" to test the server manually.');
@@ -91,6 +80,11 @@ async function startServer() {
   let buffer = '';
   process.stdin.on('data', async (chunk) => {
     buffer += chunk;
+
+    // No new line terminator: don't re-split the whole pending buffer
+    if (!chunk.includes('\n')) {
+      return;
+    }
     
     // Process complete lines (JSON-RPC messages)
     let lines = buffer.split('\n');
@@ -1,9 +1,9 @@
-const axios = require('axios');
-
 class PromptOptimizerApiClient {
   constructor(apiKey, backendUrl = 'https://p01--project-optimizer--fvrdk8m9k9j.code.run') {
     this.apiKey = apiKey;
     this.backendUrl = backendUrl;
+    // Deferred so --help/--version/--setup skip loading axios
+    const axios = require('axios');
     this.client = axios.create({
       baseURL: backendUrl,
       headers: {
@@ -57,12 +57,12 @@ class Config {
 
   clear() {
     try {
-      if (fs.existsSync(this.configFile)) {
-        fs.unlinkSync(this.configFile);
-        return true;
-      }
+      fs.unlinkSync(this.configFile);
+      return true;
     } catch (error) {
-      console.error('Error clearing config:', error.message);
+      if (error.code !== 'ENOENT') {
+        console.error('Error clearing config:', error.message);
+      }
     }
     return false;
   }
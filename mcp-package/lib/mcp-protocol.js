@@ -1,4 +1,25 @@
 const PromptOptimizerApiClient = require('./api-client');
+const { version } = require('../package.json');
+
+const PROTOCOL_VERSION = "2024-11-05";
+const SERVER_INFO = Object.freeze({
+  name: "mcp-prompt-optimizer",
+  version
+});
+
+const OPTIMIZATION_GOALS = Object.freeze([
+  "clarity",
+  "conciseness",
+  "technical_accuracy",
+  "contextual_relevance",
+  "specificity",
+  "actionability",
+  "structure",
+  "technical_precision",
+  "linguistic_precision",
+  "holistic_effectiveness"
+]);
+const VALID_GOALS = new Set(OPTIMIZATION_GOALS);
 
 class MCPServer {
   constructor(apiKey) {
@@ -17,18 +38,7 @@ class MCPServer {
             type: "array", 
             items: { 
               type: "string",
-              enum: [
-                "clarity", 
-                "conciseness", 
-                "technical_accuracy", 
-                "contextual_relevance", 
-                "specificity", 
-                "actionability", 
-                "structure", 
-                "technical_precision",
-                "linguistic_precision", 
-                "holistic_effectiveness"
-              ]
+              enum: OPTIMIZATION_GOALS
             },
             description: "Optimization goals (default: clarity)",
             default: ["clarity"]
@@ -58,7 +68,8 @@ class MCPServer {
       const { prompt, goals = ['clarity'] } = args;
       
       // Validate prompt
-      if (!prompt || typeof prompt !== 'string' || prompt.trim().length === 0) {
+      const trimmedPrompt = typeof prompt === 'string' ? prompt.trim() : '';
+      if (trimmedPrompt.length === 0) {
         return {
           content: [{
             type: "text",
@@ -69,19 +80,13 @@ class MCPServer {
       }
 
       // Validate goals
-      const validGoals = [
-        "clarity", "conciseness", "technical_accuracy", "contextual_relevance", 
-        "specificity", "actionability", "structure", "technical_precision",
-        "linguistic_precision", "holistic_effectiveness"
-      ];
-      
-      const filteredGoals = goals.filter(goal => validGoals.includes(goal));
+      const filteredGoals = goals.filter(goal => VALID_GOALS.has(goal));
       if (filteredGoals.length === 0) {
         filteredGoals.push('clarity'); // Default fallback
       }
       
       try {
-        const result = await this.apiClient.optimize(prompt.trim(), filteredGoals);
+        const result = await this.apiClient.optimize(trimmedPrompt, filteredGoals);
         
         return {
           content: [{
@@ -113,14 +118,11 @@ class MCPServer {
             jsonrpc: "2.0",
             id, 
             result: { 
-              protocolVersion: "2024-11-05",
+              protocolVersion: PROTOCOL_VERSION,
               capabilities: {
                 tools: {}
               },
-              serverInfo: {
-                name: "mcp-prompt-optimizer",
-                version: "1.0.0"
-              }
+              serverInfo: SERVER_INFO
             } 
           };
           